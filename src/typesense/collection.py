@@ -22,8 +22,6 @@ import sys
 
 from typing_extensions import deprecated
 
-from typesense.types.collection import CollectionSchema, CollectionUpdateSchema
-
 if sys.version_info >= (3, 11):
     import typing
 else:
@@ -33,6 +31,7 @@ from typesense.api_call import ApiCall
 from typesense.documents import Documents
 from typesense.overrides import Overrides
 from typesense.synonyms import Synonyms
+from typesense.types.collection import CollectionSchema, CollectionUpdateSchema
 from typesense.types.document import DocumentSchema
 
 TDoc = typing.TypeVar("TDoc", bound=DocumentSchema)
@@ -62,12 +61,33 @@ class Collection(typing.Generic[TDoc]):
             api_call (ApiCall): The ApiCall instance for making API requests.
             name (str): The name of the collection.
         """
-        self.name = name
+        # Imported here to avoid a circular import with typesense.collections
+        from typesense.collections import Collections
+
+        self._name = name
         self.api_call = api_call
+        self._endpoint_path = "/".join([Collections.resource_path, name])
+
+        # Bound once so each request skips the api_call attribute lookup
+        self._get = api_call.get
+        self._patch = api_call.patch
+        self._delete = api_call.delete
         self.documents: Documents[TDoc] = Documents(api_call, name)
         self._overrides = Overrides(api_call, name)
         self._synonyms = Synonyms(api_call, name)
 
+    @property
+    def name(self) -> str:
+        """
+        Get the name of this collection.
+
+        The name is read-only, since the endpoint path is built from it once.
+
+        Returns:
+            str: The name of the collection.
+        """
+        return self._name
+
     @property
     @deprecated(
         "Synonyms is deprecated on v30+. Use client.synonym_sets instead.",
@@ -91,7 +111,7 @@ class Collection(typing.Generic[TDoc]):
         Returns:
             CollectionSchema: The schema of the collection.
         """
-        response: CollectionSchema = self.api_call.get(
+        response: CollectionSchema = self._get(
             endpoint=self._endpoint_path,
             entity_type=CollectionSchema,
             as_json=True,
@@ -109,7 +129,7 @@ class Collection(typing.Generic[TDoc]):
         Returns:
             CollectionUpdateSchema: The updated schema of the collection.
         """
-        response: CollectionUpdateSchema = self.api_call.patch(
+        response: CollectionUpdateSchema = self._patch(
             endpoint=self._endpoint_path,
             body=schema_change,
             entity_type=CollectionUpdateSchema,
@@ -133,21 +153,9 @@ class Collection(typing.Generic[TDoc]):
         Returns:
             CollectionSchema: The schema of the deleted collection.
         """
-        response: CollectionSchema = self.api_call.delete(
+        response: CollectionSchema = self._delete(
             self._endpoint_path,
             entity_type=CollectionSchema,
             params=delete_parameters,
         )
         return response
-
-    @property
-    def _endpoint_path(self) -> str:
-        """
-        Get the API endpoint path for this collection.
-
-        Returns:
-            str: The full endpoint path for the collection.
-        """
-        from typesense.collections import Collections
-
-        return "/".join([Collections.resource_path, self.name])
@@ -16,6 +16,7 @@ Exceptions:
 
 from __future__ import annotations
 
+import functools
 import sys
 import time
 
@@ -24,11 +25,112 @@ if sys.version_info >= (3, 11):
 else:
     import typing_extensions as typing
 
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 
 from typesense.exceptions import ConfigError
 from typesense.logger import logger
 
+_TStr = typing.TypeVar("_TStr", bound=str)
+
+
+def _intern(value: _TStr) -> _TStr:
+    """
+    Intern a string, leaving str subclasses such as str-based Enum members unchanged.
+
+    Args:
+        value (str): The string to intern.
+
+    Returns:
+        str: The interned string, or the original value if it is not an exact str.
+    """
+    if type(value) is str:
+        return typing.cast(_TStr, sys.intern(value))
+    return value
+
+
+_REQUIRED_NODE_FIELDS: typing.Tuple[str, ...] = ("host", "port", "protocol")
+
+_ERR_NODES = "`nodes` is not defined."
+_ERR_API_KEY = "`api_key` is not defined."
+_ERR_NODE_SHAPE = " ".join(
+    [
+        "{0} entry must be a URL string or a dictionary",
+        "with the following required keys:",
+        "host, port, protocol",
+    ],
+)
+
+_DEPRECATED_KEYS: typing.Tuple[typing.Tuple[str, str], ...] = (
+    (
+        "timeout_seconds",
+        " ".join(
+            [
+                "Deprecation warning: timeout_seconds is now renamed",
+                "to connection_timeout_seconds",
+            ],
+        ),
+    ),
+    (
+        "master_node",
+        " ".join(
+            [
+                "Deprecation warning: master_node is now consolidated",
+                "to nodes,starting with Typesense Server v0.12",
+            ],
+        ),
+    ),
+    (
+        "read_replica_nodes",
+        " ".join(
+            [
+                "Deprecation warning: read_replica_nodes is now",
+                "consolidated to nodes, starting with Typesense Server v0.12",
+            ],
+        ),
+    ),
+)
+
+
+# Optional settings and their defaults, applied by Configuration.__init__
+_CONFIG_DEFAULTS: typing.Tuple[typing.Tuple[str, object], ...] = (
+    ("api_key", " "),
+    ("connection_timeout_seconds", 3.0),
+    ("num_retries", 3),
+    ("retry_interval_seconds", 1.0),
+    ("healthcheck_interval_seconds", 60),
+    ("verify", True),
+    ("suppress_deprecation_warnings", False),
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_node_url(url: str) -> typing.Tuple[str, int, str, str]:
+    """
+    Parse and validate a node URL string.
+
+    The result is cached, since the same node URLs tend to be parsed
+    whenever a client configuration is created.
+
+    Args:
+        url (str): The URL string to parse.
+
+    Returns:
+        tuple[str, int, str, str]: The host name, port, path, and protocol of the node.
+
+    Raises:
+        ConfigError: If the URL does not contain the host name, port number, or protocol.
+    """
+    parsed = urlsplit(url)
+    hostname, port, scheme = parsed.hostname, parsed.port, parsed.scheme
+    if hostname and port and scheme:
+        return hostname, port, parsed.path, scheme
+
+    if not hostname:
+        raise ConfigError("Node URL does not contain the host name.")
+    if not port:
+        raise ConfigError("Node URL does not contain the port.")
+    raise ConfigError("Node URL does not contain the protocol.")
+
 
 class NodeConfigDict(typing.TypedDict):
     """
@@ -52,8 +154,8 @@ class ConfigDict(typing.TypedDict):
     A dictionary that represents the configuration for the Typesense client.
 
     Attributes:
-        nodes (list[typing.Union[str, NodeConfigDict]]): A list of dictionaries or URLs that
-            represent the nodes in the cluster.
+        nodes (str | list[typing.Union[str, NodeConfigDict]]): A list of dictionaries or
+            URLs that represent the nodes in the cluster, or a single node URL.
 
         nearest_node (typing.Union[str, NodeConfigDict]): A dictionary or URL
             that represents the nearest node to the client.
@@ -84,7 +186,7 @@ class ConfigDict(typing.TypedDict):
         suppress_deprecation_warnings (bool): Whether to suppress deprecation warnings.
     """
 
-    nodes: typing.List[typing.Union[str, NodeConfigDict]]
+    nodes: typing.Union[str, typing.List[typing.Union[str, NodeConfigDict]]]
     nearest_node: typing.NotRequired[typing.Union[str, NodeConfigDict]]
     api_key: str
     num_retries: typing.NotRequired[int]
@@ -113,12 +215,23 @@ class Node:
         healthy (bool): Whether the node is healthy or not.
     """
 
+    __slots__ = (
+        "_host",
+        "_port",
+        "_path",
+        "_protocol",
+        "_url",
+        "healthy",
+        "last_access_ts",
+    )
+
     def __init__(
         self,
         host: str,
         port: typing.Union[str, int],
         path: str,
         protocol: typing.Union[typing.Literal["http", "https"], str],
+        last_access_ts: typing.Union[int, None] = None,
     ) -> None:
         """
         Initialize a Node object with the specified host, port, path, and protocol.
@@ -128,25 +241,86 @@ class Node:
             port (str | int): The port number of the node.
             path (str): The path of the node.
             protocol (typing.Literal['http', 'https'] | str): The protocol of the node.
+            last_access_ts (int | None): The initial last access timestamp.
+                Defaults to the current time.
         """
-        self.host = host
-        self.port = port
-        self.path = path
-        self.protocol = protocol
+        # Hosts and protocols repeat across a cluster's nodes, so share one copy
+        self._host = _intern(host)
+        self._port = port
+        self._path = path
+        self._protocol = _intern(protocol)
+
+        # Build the URL once; it is rebuilt only if one of its fields is reassigned
+        self._recompute_url()
 
         # Used to skip bad hosts
         self.healthy = True
 
         # Used to track the last time this node was accessed
-        self.last_access_ts: int = int(time.time())
+        if last_access_ts is None:
+            last_access_ts = int(time.time())
+        self.last_access_ts: int = last_access_ts
+
+    @property
+    def host(self) -> str:
+        """The host name of the node."""
+        return self._host
+
+    @host.setter
+    def host(self, host: str) -> None:
+        self._host = _intern(host)
+        self._recompute_url()
+
+    @property
+    def port(self) -> typing.Union[str, int]:
+        """The port number of the node."""
+        return self._port
+
+    @port.setter
+    def port(self, port: typing.Union[str, int]) -> None:
+        self._port = port
+        self._recompute_url()
+
+    @property
+    def path(self) -> str:
+        """The path of the node."""
+        return self._path
+
+    @path.setter
+    def path(self, path: str) -> None:
+        self._path = path
+        self._recompute_url()
+
+    @property
+    def protocol(self) -> typing.Union[typing.Literal["http", "https"], str]:
+        """The protocol of the node."""
+        return self._protocol
+
+    @protocol.setter
+    def protocol(
+        self,
+        protocol: typing.Union[typing.Literal["http", "https"], str],
+    ) -> None:
+        self._protocol = _intern(protocol)
+        self._recompute_url()
+
+    def _recompute_url(self) -> None:
+        """Rebuild the cached URL from the host, port, path, and protocol."""
+        self._url = f"{self._protocol}://{self._host}:{self._port}{self._path}"
 
     @classmethod
-    def from_url(cls, url: str) -> "Node":
+    def from_url(
+        cls,
+        url: str,
+        last_access_ts: typing.Union[int, None] = None,
+    ) -> "Node":
         """
         Initialize a Node object from a URL string.
 
         Args:
             url (str): The URL string to parse.
+            last_access_ts (int | None): The initial last access timestamp.
+                Defaults to the current time.
 
         Returns:
             Node: The Node object created from the URL string.
@@ -154,15 +328,33 @@ class Node:
         Raises:
             ConfigError: If the URL does not contain the host name, port number, or protocol.
         """
-        parsed = urlparse(url)
-        if not parsed.hostname:
-            raise ConfigError("Node URL does not contain the host name.")
-        if not parsed.port:
-            raise ConfigError("Node URL does not contain the port.")
-        if not parsed.scheme:
-            raise ConfigError("Node URL does not contain the protocol.")
+        host, port, path, protocol = _parse_node_url(url)
+        return cls(host, port, path, protocol, last_access_ts)
 
-        return cls(parsed.hostname, parsed.port, parsed.path, parsed.scheme)
+    @classmethod
+    def from_dict(
+        cls,
+        node_config: NodeConfigDict,
+        last_access_ts: typing.Union[int, None] = None,
+    ) -> "Node":
+        """
+        Initialize a Node object from a node configuration dictionary.
+
+        Args:
+            node_config (NodeConfigDict): The node configuration dictionary.
+            last_access_ts (int | None): The initial last access timestamp.
+                Defaults to the current time.
+
+        Returns:
+            Node: The Node object created from the dictionary.
+        """
+        return cls(
+            node_config["host"],
+            node_config["port"],
+            node_config.get("path", ""),
+            node_config["protocol"],
+            last_access_ts,
+        )
 
     def url(self) -> str:
         """
@@ -171,7 +363,7 @@ class Node:
         Returns:
             str: The URL of the node
         """
-        return f"{self.protocol}://{self.host}:{self.port}{self.path}"
+        return self._url
 
 
 class Configuration:
@@ -189,6 +381,28 @@ class Configuration:
         verify (bool): Whether to verify the SSL certificate.
     """
 
+    __slots__ = (
+        "validations",
+        "nodes",
+        "nearest_node",
+        "api_key",
+        "connection_timeout_seconds",
+        "num_retries",
+        "retry_interval_seconds",
+        "healthcheck_interval_seconds",
+        "verify",
+        "additional_headers",
+        "suppress_deprecation_warnings",
+    )
+
+    api_key: str
+    connection_timeout_seconds: float
+    num_retries: int
+    retry_interval_seconds: float
+    healthcheck_interval_seconds: int
+    verify: bool
+    suppress_deprecation_warnings: bool
+
     def __init__(
         self,
         config_dict: ConfigDict,
@@ -199,71 +413,113 @@ class Configuration:
         Args:
             config_dict (ConfigDict): A dictionary containing the configuration settings.
         """
+        ConfigurationValidations.show_deprecation_warnings(config_dict)
+        ConfigurationValidations.validate_required_config_fields(config_dict)
+        self._init_from_dict(config_dict, validate=True)
+
+    @classmethod
+    def from_validated(cls, config_dict: ConfigDict) -> "Configuration":
+        """
+        Create a Configuration object from an already validated configuration dictionary.
+
+        This skips the validation and deprecation warnings done by the constructor,
+        so it is meant for SDK internal use with dictionaries known to be well formed.
+
+        Args:
+            config_dict (ConfigDict): A validated dictionary containing the
+                configuration settings.
+
+        Returns:
+            Configuration: The Configuration object created from the dictionary.
+        """
+        configuration = cls.__new__(cls)
+        configuration._init_from_dict(config_dict, validate=False)
+        return configuration
+
+    def _init_from_dict(self, config_dict: ConfigDict, validate: bool) -> None:
+        """
+        Build the nodes and settings from the configuration dictionary.
+
+        Args:
+            config_dict (ConfigDict): A dictionary containing the configuration settings.
+            validate (bool): Whether to validate each node entry as it is built.
+        """
         self.validations = ConfigurationValidations
-        self.validations.show_deprecation_warnings(config_dict)
-        self.validations.validate_config_dict(config_dict)
 
-        self.nodes: typing.List[Node] = [
-            self._initialize_nodes(node) for node in config_dict["nodes"]
-        ]
+        # All nodes are created together, so they share one initial timestamp
+        now = int(time.time())
+
+        raw_nodes = config_dict["nodes"]
+        if isinstance(raw_nodes, str):
+            self.nodes: typing.List[Node] = [Node.from_url(raw_nodes, now)]
+        else:
+            # When validating, each node entry is checked as it is built
+            self.nodes = [
+                self._initialize_nodes(node, now, validate=validate)
+                for node in raw_nodes
+            ]
 
         nearest_node = config_dict.get("nearest_node", None)
 
-        self.nearest_node = self._handle_nearest_node(nearest_node)
-        self.api_key = config_dict.get("api_key", " ")
-        self.connection_timeout_seconds = config_dict.get(
-            "connection_timeout_seconds",
-            3.0,
-        )
-        self.num_retries = config_dict.get("num_retries", 3)
-        self.retry_interval_seconds = config_dict.get("retry_interval_seconds", 1.0)
-        self.healthcheck_interval_seconds = config_dict.get(
-            "healthcheck_interval_seconds",
-            60,
+        self.nearest_node = self._handle_nearest_node(
+            nearest_node,
+            now,
+            validate=validate,
         )
-        self.verify = config_dict.get("verify", True)
+        for attribute, default in _CONFIG_DEFAULTS:
+            setattr(self, attribute, config_dict.get(attribute, default))
         self.additional_headers = config_dict.get("additional_headers", {})
-        self.suppress_deprecation_warnings = config_dict.get("suppress_deprecation_warnings", False)
 
     def _handle_nearest_node(
         self,
         nearest_node: typing.Union[str, NodeConfigDict, None],
+        last_access_ts: typing.Union[int, None] = None,
+        *,
+        validate: bool,
     ) -> typing.Union[Node, None]:
         """
         Handle the nearest node configuration.
 
         Args:
             nearest_node (str | NodeConfigDict): The nearest node configuration.
+            last_access_ts (int | None): The initial last access timestamp.
+            validate (bool): Whether to validate the nearest node first.
 
         Returns:
             Node | None: The nearest node object if it exists, None otherwise.
         """
         if nearest_node is None:
             return None
-        return self._initialize_nodes(nearest_node)
+        if validate:
+            self.validations.validate_nearest_node(nearest_node)
+        # Already validated above, with the nearest_node specific message
+        return self._initialize_nodes(nearest_node, last_access_ts, validate=False)
 
     def _initialize_nodes(
         self,
         node: typing.Union[str, NodeConfigDict],
+        last_access_ts: typing.Union[int, None] = None,
+        *,
+        validate: bool,
     ) -> Node:
         """
         Handle the initialization of a node.
 
         Args:
             node (Node): The node to initialize.
+            last_access_ts (int | None): The initial last access timestamp.
+            validate (bool): Whether to validate the node first.
 
         Returns:
             Node: The initialized node.
         """
+        if validate:
+            self.validations.validate_node(node)
+
         if isinstance(node, str):
-            return Node.from_url(node)
+            return Node.from_url(node, last_access_ts)
 
-        return Node(
-            node["host"],
-            node["port"],
-            node.get("path", ""),
-            node["protocol"],
-        )
+        return Node.from_dict(node, last_access_ts)
 
 
 class ConfigurationValidations:
@@ -299,33 +555,43 @@ class ConfigurationValidations:
             ConfigError: If the configuration dictionary is missing required fields.
         """
         if not config_dict.get("nodes"):
-            raise ConfigError("`nodes` is not defined.")
+            raise ConfigError(_ERR_NODES)
 
         if not config_dict.get("api_key"):
-            raise ConfigError("`api_key` is not defined.")
+            raise ConfigError(_ERR_API_KEY)
 
     @staticmethod
-    def validate_nodes(nodes: typing.List[typing.Union[str, NodeConfigDict]]) -> None:
+    def validate_nodes(
+        nodes: typing.Union[str, typing.List[typing.Union[str, NodeConfigDict]]],
+    ) -> None:
         """
         Validate the nodes in the configuration dictionary.
 
         Args:
-            nodes (list): The list of nodes to validate.
+            nodes (str | list): The node URL or the list of nodes to validate.
 
         Raises:
             ConfigError: If any node is invalid.
         """
+        if isinstance(nodes, str):
+            return
+
         for node in nodes:
-            if not ConfigurationValidations.validate_node_fields(node):
-                raise ConfigError(
-                    " ".join(
-                        [
-                            "`node` entry must be a URL string or a",
-                            "dictionary with the following required keys:",
-                            "host, port, protocol",
-                        ],
-                    ),
-                )
+            ConfigurationValidations.validate_node(node)
+
+    @staticmethod
+    def validate_node(node: typing.Union[str, NodeConfigDict]) -> None:
+        """
+        Validate a single node in the configuration dictionary.
+
+        Args:
+            node (str | NodeConfigDict): The node to validate.
+
+        Raises:
+            ConfigError: If the node is invalid.
+        """
+        if not ConfigurationValidations.validate_node_fields(node):
+            raise ConfigError(_ERR_NODE_SHAPE.format("`node`"))
 
     @staticmethod
     def validate_nearest_node(nearest_node: typing.Union[str, NodeConfigDict]) -> None:
@@ -339,15 +605,7 @@ class ConfigurationValidations:
             ConfigError: If the nearest node is invalid.
         """
         if not ConfigurationValidations.validate_node_fields(nearest_node):
-            raise ConfigError(
-                " ".join(
-                    [
-                        "`nearest_node` entry must be a URL string or a dictionary",
-                        "with the following required keys:",
-                        "host, port, protocol",
-                    ],
-                ),
-            )
+            raise ConfigError(_ERR_NODE_SHAPE.format("`nearest_node`"))
 
     @staticmethod
     def validate_node_fields(node: typing.Union[str, NodeConfigDict]) -> bool:
@@ -362,8 +620,10 @@ class ConfigurationValidations:
         """
         if isinstance(node, str):
             return True
-        expected_fields = {"host", "port", "protocol"}
-        return expected_fields.issubset(node)
+        for field in _REQUIRED_NODE_FIELDS:
+            if field not in node:
+                return False
+        return True
 
     @staticmethod
     def show_deprecation_warnings(config_dict: ConfigDict) -> None:
@@ -374,32 +634,6 @@ class ConfigurationValidations:
             config_dict (ConfigDict): The configuration dictionary
                 to check for deprecated fields.
         """
-        if config_dict.get("timeout_seconds"):
-            logger.warning(
-                " ".join(
-                    [
-                        "Deprecation warning: timeout_seconds is now renamed",
-                        "to connection_timeout_seconds",
-                    ],
-                ),
-            )
-
-        if config_dict.get("master_node"):
-            logger.warning(
-                " ".join(
-                    [
-                        "Deprecation warning: master_node is now consolidated",
-                        "to nodes,starting with Typesense Server v0.12",
-                    ],
-                ),
-            )
-
-        if config_dict.get("read_replica_nodes"):
-            logger.warning(
-                " ".join(
-                    [
-                        "Deprecation warning: read_replica_nodes is now",
-                        "consolidated to nodes, starting with Typesense Server v0.12",
-                    ],
-                ),
-            )
+        for deprecated_key, message in _DEPRECATED_KEYS:
+            if deprecated_key in config_dict:
+                logger.warning(message)
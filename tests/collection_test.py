@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import time
 
+import pytest
 import requests_mock
 
 from tests.utils.object_assertions import (
@@ -35,6 +36,14 @@ def test_init(fake_api_call: ApiCall) -> None:
     assert collection._endpoint_path == "/collections/companies"  # noqa: WPS437
 
 
+def test_name_is_read_only(fake_collection: Collection) -> None:
+    """Test that the name of the Collection object cannot be reassigned."""
+    with pytest.raises(AttributeError):
+        fake_collection.name = "other"  # type: ignore[misc]
+
+    assert fake_collection._endpoint_path == "/collections/companies"
+
+
 def test_retrieve(fake_collection: Collection) -> None:
     """Test that the Collection object can retrieve a collection."""
     time_now = int(time.time())
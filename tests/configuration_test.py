@@ -3,6 +3,7 @@
 import types
 
 import pytest
+from pytest_mock import MockerFixture
 
 from tests.utils.object_assertions import (
     assert_match_object,
@@ -114,6 +115,67 @@ def test_configuration_no_nearest_node() -> None:
     assert_to_contain_object(configuration, expected)
 
 
+def test_configuration_nodes_share_last_access_ts(mocker: MockerFixture) -> None:
+    """Test that all configured nodes get the same initial timestamp."""
+    mocker.patch("time.time", side_effect=[100, 101, 102, 103, 104])
+    config: ConfigDict = {
+        "nodes": [DEFAULT_NODE, "http://localhost:8109"],
+        "nearest_node": "http://localhost:8110",
+        "api_key": "xyz",
+    }
+
+    configuration = Configuration(config)
+
+    assert configuration.nearest_node is not None
+    timestamps = {node.last_access_ts for node in configuration.nodes}
+    timestamps.add(configuration.nearest_node.last_access_ts)
+
+    assert timestamps == {100}
+
+
+def test_configuration_string_nodes() -> None:
+    """Test the Configuration constructor with nodes as a single URL string."""
+    config: ConfigDict = {
+        "nodes": "http://localhost:8108",
+        "api_key": "xyz",
+    }
+
+    configuration = Configuration(config)
+
+    nodes = [Node(host="localhost", port=8108, protocol="http", path="")]
+
+    assert_object_lists_match(configuration.nodes, nodes)
+
+
+def test_configuration_from_validated(caplog: pytest.LogCaptureFixture) -> None:
+    """Test creating a Configuration from a validated dictionary."""
+    config: ConfigDict = {
+        "nodes": [DEFAULT_NODE],
+        "nearest_node": "http://localhost:8108",
+        "api_key": "xyz",
+        "timeout_seconds": 10,
+    }
+
+    configuration = Configuration.from_validated(config)
+
+    nodes = [Node(host="localhost", port=8108, protocol="http", path="")]
+    nearest_node = Node(host="localhost", port=8108, protocol="http", path="")
+
+    assert_object_lists_match(configuration.nodes, nodes)
+    assert_match_object(configuration.nearest_node, nearest_node)
+
+    expected = {
+        "api_key": "xyz",
+        "connection_timeout_seconds": 3.0,
+        "num_retries": 3,
+        "retry_interval_seconds": 1.0,
+        "verify": True,
+    }
+
+    assert_to_contain_object(configuration, expected)
+    assert "Deprecation warning" not in caplog.text
+
+
 def test_configuration_empty_nodes() -> None:
     """Test the Configuration constructor with empty nodes."""
     config: ConfigDict = {
@@ -54,6 +54,19 @@ def test_deprecation_warning_timeout_seconds(caplog: pytest.LogCaptureFixture) -
     )
 
 
+def test_deprecation_warning_falsy_timeout_seconds(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test that a deprecation warning is issued even if 'timeout_seconds' is 0."""
+    config_dict: ConfigDict = {
+        "nodes": [DEFAULT_NODE],
+        "api_key": "xyz",
+        "timeout_seconds": 0,
+    }
+    ConfigurationValidations.show_deprecation_warnings(config_dict)
+    assert "Deprecation warning: timeout_seconds is now renamed" in caplog.text
+
+
 def test_deprecation_warning_master_node(caplog: pytest.LogCaptureFixture) -> None:
     """Test that a deprecation warning is issued for the 'master_node' field."""
     config_dict: ConfigDict = {
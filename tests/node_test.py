@@ -1,5 +1,6 @@
 """Tests for the Node class."""
 
+import enum
 import time
 
 import pytest
@@ -25,6 +26,37 @@ def test_node_initialization() -> None:
     assert_match_object(node, expected)
 
 
+def test_node_initialization_with_last_access_ts() -> None:
+    """Test the initialization of the Node class with an explicit timestamp."""
+    node = Node(
+        host="localhost",
+        port=8108,
+        path="/path",
+        protocol="http",
+        last_access_ts=100,
+    )
+
+    assert node.last_access_ts == 100
+
+
+def test_node_initialization_with_str_subclasses() -> None:
+    """Test the initialization of the Node class with str subclass values."""
+
+    class Host(str):
+        """A str subclass used as a host name."""
+
+    class Protocol(str, enum.Enum):
+        """A str-based Enum used as a protocol."""
+
+        HTTP = "http"
+
+    host = Host("localhost")
+    node = Node(host=host, port=8108, path="/path", protocol=Protocol.HTTP)
+
+    assert node.host is host
+    assert node.protocol is Protocol.HTTP
+
+
 def test_node_from_url() -> None:
     """Test the initialization of the Node class using a URL."""
     node = Node.from_url("http://localhost:8108/path")
@@ -41,6 +73,33 @@ def test_node_from_url() -> None:
     assert_match_object(node, expected)
 
 
+def test_node_from_url_returns_new_node() -> None:
+    """Test that parsing the same URL twice does not share Node objects."""
+    node = Node.from_url("http://localhost:8108/path")
+    other_node = Node.from_url("http://localhost:8108/path")
+
+    node.healthy = False
+
+    assert node is not other_node
+    assert other_node.healthy
+
+
+def test_node_from_dict() -> None:
+    """Test the initialization of the Node class using a dictionary."""
+    node = Node.from_dict({"host": "localhost", "port": 8108, "protocol": "http"})
+
+    current_time = int(time.time())
+    expected = {
+        "host": "localhost",
+        "port": 8108,
+        "path": "",
+        "protocol": "http",
+        "healthy": True,
+        "last_access_ts": current_time,
+    }
+    assert_match_object(node, expected)
+
+
 def test_node_from_url_missing_hostname() -> None:
     """Test the initialization of the Node class using a URL without a host name."""
     with pytest.raises(ConfigError, match="Node URL does not contain the host name."):
@@ -63,3 +122,15 @@ def test_node_url() -> None:
     """Test the URL method of the Node class."""
     node = Node(host="localhost", port=8108, path="/path", protocol="http")
     assert node.url() == "http://localhost:8108/path"
+
+
+def test_node_url_after_field_update() -> None:
+    """Test that the URL of the Node class follows updates to its fields."""
+    node = Node(host="localhost", port=8108, path="/path", protocol="http")
+
+    node.host = "example.com"
+    node.port = 443
+    node.path = ""
+    node.protocol = "https"
+
+    assert node.url() == "https://example.com:443"
@@ -20,7 +20,9 @@ def obj_to_dict(
     """
     Convert an object to a dictionary.
 
-    If the object is already a dictionary, return it as is.
+    If the object is already a dictionary, return it as is. Objects that use
+    `__slots__` are converted from their initialized public slot attributes,
+    with private slots only included when backing a public property.
 
     Args:
         input_obj: The object to convert.
@@ -28,7 +30,24 @@ def obj_to_dict(
     Returns:
         The object as a dictionary.
     """
-    return input_obj if isinstance(input_obj, typing.Dict) else input_obj.__dict__
+    if isinstance(input_obj, typing.Dict):
+        return input_obj
+
+    if hasattr(input_obj, "__dict__"):
+        return input_obj.__dict__
+
+    attributes: typing.Dict[str, typing.Any] = {}
+    for klass in type(input_obj).__mro__:
+        for slot in getattr(klass, "__slots__", ()):
+            name = slot.lstrip("_")
+            if slot != name and not isinstance(
+                getattr(type(input_obj), name, None),
+                property,
+            ):
+                continue
+            if hasattr(input_obj, slot):
+                attributes[name] = getattr(input_obj, name)
+    return attributes
 
 
 def assert_match_object(